@@ -2,6 +2,8 @@
 
 import os
 from functools import lru_cache
+from typing import Literal
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -14,6 +16,13 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     api_key_prefix: str = "lt_"
     db_path: str = "/data/productname.db"
+    db_replica_path: str = ""
+    db_synchronous: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"
+    db_cache_size: int = -64_000
+    db_mmap_size: int = 268_435_456
+    db_busy_timeout: int = 5_000
+    db_temp_store: Literal["DEFAULT", "FILE", "MEMORY"] = "MEMORY"
+    db_wal_autocheckpoint: int = 1_000
     smtp_host: str = "smtp.zoho.com"
     smtp_port: int = 587
     smtp_user: str = ""
@@ -28,6 +37,11 @@ class Settings(BaseSettings):
         env_file = ".env"
         extra = "ignore"
 
+    @field_validator("db_synchronous", "db_temp_store", mode="before")
+    @classmethod
+    def _upper_pragma_value(cls, value):
+        return value.upper() if isinstance(value, str) else value
+
     @property
     def is_production(self) -> bool:
         return self.app_environment == "production"
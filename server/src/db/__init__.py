@@ -1,3 +1,3 @@
 """Database module."""
-from .connection import get_db, init_db, log_audit
-__all__ = ["get_db", "init_db", "log_audit"]
+from .connection import close_read_db, get_db, get_read_db, init_db, log_audit
+__all__ = ["close_read_db", "get_db", "get_read_db", "init_db", "log_audit"]
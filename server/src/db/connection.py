@@ -1,7 +1,9 @@
 """SQLite database connection."""
 import json
 import logging
+import os
 import sqlite3
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -9,6 +11,10 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 _connection: Optional[sqlite3.Connection] = None
+_UNSET = object()
+_read_lock = threading.Lock()
+_read_connection: sqlite3.Connection | None = None
+_read_signature: object = _UNSET
 
 def get_db() -> sqlite3.Connection:
     global _connection
@@ -16,18 +22,92 @@ def get_db() -> sqlite3.Connection:
         _connection = init_db()
     return _connection
 
+def get_read_db() -> sqlite3.Connection:
+    """Read-only connection for reporting queries that tolerate stale data.
+
+    Uses the Litestream-restored replica at ``db_replica_path`` when configured,
+    otherwise the primary. The replica is reopened whenever the file is replaced
+    (new inode or mtime), so re-running ``litestream restore`` needs no restart;
+    ``close_read_db()`` forces a reopen. A replica that fails to open or lacks the
+    schema is logged once per file version and the primary is used instead.
+    Superseded handles are not closed, so queries still running on them finish;
+    they are closed when garbage-collected.
+    """
+    global _read_connection, _read_signature
+    path = settings.db_replica_path
+    if not path:
+        return get_db()
+    with _read_lock:
+        signature = _file_signature(path)
+        if signature != _read_signature:
+            _read_connection = None
+            _read_signature = signature
+            try:
+                _read_connection = _open_read_db(path)
+            except sqlite3.Error as e:
+                logger.warning(f"Replica unavailable at {path}, using primary: {e}")
+        conn = _read_connection
+    return conn if conn is not None else get_db()
+
+def close_read_db() -> None:
+    """Drop the replica connection so the next ``get_read_db()`` reopens it."""
+    global _read_connection, _read_signature
+    with _read_lock:
+        _read_connection = None
+        _read_signature = _UNSET
+
+def _file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns
+
+def _apply_pragmas(conn: sqlite3.Connection, read_only: bool = False) -> None:
+    conn.execute(f"PRAGMA busy_timeout = {int(settings.db_busy_timeout)}")
+    conn.execute(f"PRAGMA cache_size = {int(settings.db_cache_size)}")
+    conn.execute(f"PRAGMA mmap_size = {int(settings.db_mmap_size)}")
+    conn.execute(f"PRAGMA temp_store = {settings.db_temp_store}")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
+        return
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute(f"PRAGMA synchronous = {settings.db_synchronous}")
+    conn.execute(f"PRAGMA wal_autocheckpoint = {int(settings.db_wal_autocheckpoint)}")
+
 def init_db(run_schema: bool = True) -> sqlite3.Connection:
     db_path = settings.db_path
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     conn = sqlite3.connect(db_path, check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
+    _apply_pragmas(conn)
     if run_schema:
         _init_schema(conn)
     logger.info(f"Database initialized at {db_path}")
     return conn
 
+def _open_read_db(db_path: str) -> sqlite3.Connection:
+    uri = f"{Path(db_path).resolve().as_uri()}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    try:
+        conn.row_factory = sqlite3.Row
+        _apply_pragmas(conn, read_only=True)
+        rows = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        tables = {row["name"] for row in rows}
+        missing = _SCHEMA_TABLES - tables
+        if missing:
+            raise sqlite3.DatabaseError(f"missing tables: {', '.join(sorted(missing))}")
+    except sqlite3.Error:
+        conn.close()
+        raise
+    logger.info(f"Read-only database opened at {db_path}")
+    return conn
+
+# Tables a replica must contain before get_read_db() will serve it; keep in step
+# with the CREATE TABLE statements in _init_schema (enforced by the db tests).
+_SCHEMA_TABLES = {"users", "sessions", "usage", "audit_log"}
+
 def _init_schema(conn: sqlite3.Connection) -> None:
     conn.executescript("""
         CREATE TABLE IF NOT EXISTS users (
@@ -0,0 +1 @@
+"""Server tests."""
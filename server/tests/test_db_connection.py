@@ -0,0 +1,135 @@
+"""Tests for SQLite connection setup and the read-only replica."""
+import logging
+import os
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.config import Settings, settings
+from src.db import close_read_db, connection, get_db, get_read_db
+
+
+@pytest.fixture
+def db_paths(tmp_path, monkeypatch):
+    primary = tmp_path / "primary.db"
+    replica = tmp_path / "replica.db"
+    monkeypatch.setattr(settings, "db_path", str(primary))
+    monkeypatch.setattr(settings, "db_replica_path", "")
+    monkeypatch.setattr(connection, "_connection", None)
+    yield primary, replica
+    close_read_db()
+    if connection._connection is not None:
+        connection._connection.close()
+
+
+def restore_replica(primary, replica):
+    """Copy the primary the way a Litestream restore does: write a new file, rename it over."""
+    get_db().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    tmp = replica.with_suffix(".tmp")
+    shutil.copy(primary, tmp)
+    os.replace(tmp, replica)
+
+
+def test_primary_pragmas(db_paths):
+    db = get_db()
+    assert db.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert db.execute("PRAGMA cache_size").fetchone()[0] == -64000
+    assert db.execute("PRAGMA mmap_size").fetchone()[0] == 268435456
+    assert db.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert db.execute("PRAGMA temp_store").fetchone()[0] == 2
+    assert db.execute("PRAGMA wal_autocheckpoint").fetchone()[0] == 1000
+    assert db.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert db.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+
+def test_schema_tables_match_init_schema(db_paths):
+    rows = get_db().execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    tables = {row["name"] for row in rows} - {"sqlite_sequence"}
+    assert tables == connection._SCHEMA_TABLES
+
+
+def test_pragma_settings_are_case_insensitive():
+    s = Settings(db_synchronous="normal", db_temp_store="memory")
+    assert (s.db_synchronous, s.db_temp_store) == ("NORMAL", "MEMORY")
+
+
+def test_read_db_without_replica_uses_primary(db_paths):
+    assert get_read_db() is get_db()
+
+
+def test_read_db_opens_replica_read_only(db_paths, monkeypatch):
+    primary, replica = db_paths
+    restore_replica(primary, replica)
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    read_db = get_read_db()
+    assert read_db is not get_db()
+    assert get_read_db() is read_db
+    assert read_db.execute("PRAGMA query_only").fetchone()[0] == 1
+    assert read_db.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+    assert read_db.execute("SELECT COUNT(*) FROM usage").fetchone()[0] == 0
+    with pytest.raises(sqlite3.OperationalError):
+        read_db.execute("DELETE FROM usage")
+
+
+def test_missing_replica_falls_back_and_warns_once(db_paths, monkeypatch, caplog):
+    _, replica = db_paths
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    with caplog.at_level(logging.WARNING, logger=connection.__name__):
+        for _ in range(3):
+            assert get_read_db() is get_db()
+    assert len([r for r in caplog.records if "Replica unavailable" in r.message]) == 1
+
+
+def test_replica_without_schema_falls_back(db_paths, monkeypatch):
+    _, replica = db_paths
+    sqlite3.connect(replica).close()
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    assert get_read_db() is get_db()
+
+
+def test_replica_reopened_after_restore(db_paths, monkeypatch):
+    primary, replica = db_paths
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    assert get_read_db() is get_db()
+    restore_replica(primary, replica)
+    first = get_read_db()
+    assert first is not get_db()
+    get_db().execute(
+        "INSERT INTO audit_log (timestamp, action) VALUES ('2026-10-19T00:00:00', 'test')"
+    )
+    get_db().commit()
+    assert first.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 0
+    restore_replica(primary, replica)
+    second = get_read_db()
+    assert second is not first
+    assert second.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 1
+    assert first.execute("SELECT COUNT(*) FROM audit_log").fetchone()[0] == 0
+
+
+def test_concurrent_reopen_opens_once(db_paths, monkeypatch):
+    primary, replica = db_paths
+    restore_replica(primary, replica)
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    opened = []
+    open_read_db = connection._open_read_db
+
+    def counting_open(path):
+        opened.append(path)
+        return open_read_db(path)
+
+    monkeypatch.setattr(connection, "_open_read_db", counting_open)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        handles = list(pool.map(lambda _: get_read_db(), range(32)))
+    assert len(opened) == 1
+    assert all(h is handles[0] for h in handles)
+
+
+def test_close_read_db_keeps_handed_out_connection_usable(db_paths, monkeypatch):
+    primary, replica = db_paths
+    restore_replica(primary, replica)
+    monkeypatch.setattr(settings, "db_replica_path", str(replica))
+    held = get_read_db()
+    close_read_db()
+    assert get_read_db() is not held
+    assert held.execute("SELECT COUNT(*) FROM usage").fetchone()[0] == 0